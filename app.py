@@ -1,4 +1,4 @@
-from concurrent.futures import ThreadPoolExecutor    
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED    
 import streamlit as st    
 import tempfile    
 from pathlib import Path    
@@ -11,6 +11,7 @@ import string
 from pptx.dml.color import RGBColor    
 import logging    
 import time    
+import threading    
 from pydantic import BaseModel    
 from utils.highlight import highlight_ppt, save_to_csv    
 from utils.font_validation import validate_fonts_slide    
@@ -19,7 +20,7 @@ from utils.spelling_validation import is_exempted, validate_spelling_slide
 from utils.decimal_validation import validate_decimal_consistency    
 from utils.million_notation_validation import validate_million_notations  # Update import    
 from utils.validation import validate_tables, validate_charts    
-from config import PREDEFINED_PASSWORD, TECHNICAL_TERMS, NUMERIC_TERMS    
+from config import PREDEFINED_PASSWORD, TECHNICAL_TERMS, NUMERIC_TERMS, ERROR_LEVEL_ISSUES    
     
 # Initialize LanguageTool    
 grammar_tool = initialize_language_tool()    
@@ -47,30 +48,127 @@ def password_protection():
         return False    
     return True    
     
-def validate_slide(slide, slide_index, default_font, spell, grammar_tool, decimal_places):    
+def validate_slide(slide, slide_index, default_font, spell, grammar_tool, decimal_places, stop_event=None):    
     slide_issues = []    
     start_time = time.time()    
-    
-    # Validate Spelling    
-    slide_issues.extend(validate_spelling_slide(slide, slide_index + 1))    
-    # Validate Fonts    
-    slide_issues.extend(validate_fonts_slide(slide, slide_index + 1, default_font))    
-    # Validate Grammar    
-    slide_issues.extend(validate_grammar_slide(slide, slide_index + 1, grammar_tool))    
-    # Validate Decimal Consistency    
-    slide_issues.extend(validate_decimal_consistency(slide, slide_index + 1, decimal_places))    
-    # Validate Million Notations    
-    slide_issues.extend(validate_million_notations(slide, slide_index + 1))  # Update function call    
-    # Validate Tables    
-    slide_issues.extend(validate_tables(slide, slide_index + 1))    
-    # Validate Charts    
-    slide_issues.extend(validate_charts(slide, slide_index + 1))    
+    slide_number = slide_index + 1    
+    
+    checks = [    
+        # Validate Spelling    
+        lambda: validate_spelling_slide(slide, slide_number),    
+        # Validate Fonts    
+        lambda: validate_fonts_slide(slide, slide_number, default_font),    
+        # Validate Grammar    
+        lambda: validate_grammar_slide(slide, slide_number, grammar_tool),    
+        # Validate Decimal Consistency    
+        lambda: validate_decimal_consistency(slide, slide_number, decimal_places),    
+        # Validate Million Notations    
+        lambda: validate_million_notations(slide, slide_number),    
+        # Validate Tables    
+        lambda: validate_tables(slide, slide_number),    
+        # Validate Charts    
+        lambda: validate_charts(slide, slide_number),    
+    ]    
+    for check in checks:    
+        # Stop early if the run was cancelled or hit its stop condition    
+        if stop_event is not None and stop_event.is_set():    
+            logging.debug(f"Slide {slide_number} validation stopped early.")    
+            return slide_issues    
+        slide_issues.extend(check())    
     
     elapsed_time = time.time() - start_time    
-    logging.debug(f"Slide {slide_index + 1} validation completed in {elapsed_time:.2f} seconds.")    
+    logging.debug(f"Slide {slide_number} validation completed in {elapsed_time:.2f} seconds.")    
     
     return slide_issues    
     
+def cancel_validation():    
+    st.session_state['validation_cancelled'] = True    
+    
+def run_validation(presentation, slide_indexes, default_font, decimal_places, fail_fast, issue_budget, issues):    
+    """    
+    Validate slides in parallel, consuming results as each slide completes.    
+    
+    Issues are appended to `issues` as they arrive so partial results survive    
+    a cancelled run. Returns the stop reason, or None if every slide was checked.    
+    """    
+    progress_bar = st.progress(0)    
+    progress_text = st.empty()    
+    st.button("Cancel Validation", on_click=cancel_validation)    
+    results_table = st.empty()    
+    
+    stop_event = threading.Event()    
+    stop_reason = None    
+    start_time = time.time()    
+    executor = ThreadPoolExecutor()    
+    try:    
+        pending = {    
+            executor.submit(validate_slide, presentation.slides[slide_index], slide_index, default_font, spell, grammar_tool, decimal_places, stop_event)    
+            for slide_index in slide_indexes    
+        }    
+        total = len(pending)    
+        completed = 0    
+        while pending and stop_reason is None:    
+            done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)    
+            for future in done:    
+                slide_issues = future.result()    
+                completed += 1    
+                if issue_budget and len(issues) + len(slide_issues) >= issue_budget:    
+                    issues.extend(slide_issues[:issue_budget - len(issues)])    
+                    stop_reason = f"Issue budget of {issue_budget} reached."    
+                else:    
+                    issues.extend(slide_issues)    
+                if fail_fast and stop_reason is None:    
+                    first_error = next((issue for issue in slide_issues if issue.get('issue') in ERROR_LEVEL_ISSUES), None)    
+                    if first_error:    
+                        stop_reason = f"Stopped at first error: {first_error['issue']} on slide {first_error['slide']}."    
+                if stop_reason:    
+                    break    
+            if done:    
+                results_table.dataframe(issues)    
+            # Refresh on every tick so a slow slide does not freeze the display and a cancel click is picked up    
+            progress_percent = int(completed / total * 100)    
+            progress_text.text(f"Progress: {progress_percent}% ({completed}/{total} slides, {len(issues)} issues, {time.time() - start_time:.0f}s)")    
+            progress_bar.progress(progress_percent / 100)    
+    finally:    
+        # Runs on early stop and on cancellation alike: drop queued slides without waiting for running ones    
+        stop_event.set()    
+        executor.shutdown(wait=False, cancel_futures=True)    
+    
+    return stop_reason    
+    
+def save_results(temp_ppt_path, tmpdir, issues, stop_reason=None):    
+    # Slides complete out of order; report them in slide order    
+    issues = sorted(issues, key=lambda issue: issue['slide'])    
+    
+    # Save Results    
+    csv_output_path = Path(tmpdir) / "validation_report.csv"    
+    highlighted_ppt_path = Path(tmpdir) / "highlighted_presentation.pptx"    
+    save_to_csv(issues, csv_output_path)    
+    highlight_ppt(temp_ppt_path, highlighted_ppt_path, issues)    
+    
+    # Save results in session state    
+    st.session_state['csv_output'] = csv_output_path.read_bytes()    
+    st.session_state['ppt_output'] = highlighted_ppt_path.read_bytes()    
+    st.session_state['validation_completed'] = True    
+    st.session_state['issues'] = issues    
+    st.session_state['log_output_path'] = str(Path(tmpdir) / "validation_log.txt")    
+    if stop_reason:    
+        st.warning(f"Validation stopped early with partial results. {stop_reason}")    
+    else:    
+        st.success("Validation completed!")    
+    
+    # Write Log    
+    log_output_path = st.session_state['log_output_path']    
+    with open(log_output_path, "w") as log_file:    
+        for handler in logging.root.handlers[:]:    
+            logging.root.removeHandler(handler)    
+        logging.basicConfig(filename=log_output_path, level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')    
+        if stop_reason:    
+            logging.debug(f"Validation stopped early: {stop_reason}")    
+        logging.debug(f"Validation completed with {len(issues)} issues.")    
+        for issue in issues:    
+            logging.debug(f"Issue: {issue}")    
+    
 def main():    
     if not password_protection():    
         return    
@@ -82,6 +180,8 @@ def main():
     decimal_places = st.number_input("Enter the number of decimal places for validation", min_value=0, max_value=10, value=1)    
     
     validation_option = st.radio("Validation Option:", ["All Slides", "Custom Range"])    
+    fail_fast = st.checkbox("Fail fast (stop at the first spelling or grammar error)")    
+    issue_budget = st.number_input("Stop after this many issues (0 = no limit)", min_value=0, value=0)    
     
     if uploaded_file:    
         with tempfile.TemporaryDirectory() as tmpdir:    
@@ -100,47 +200,18 @@ def main():
                 end_slide = st.number_input("To Slide", min_value=start_slide, max_value=total_slides, value=end_slide_default)    
     
             if st.button("Run Validation"):    
-                progress_bar = st.progress(0)    
-                progress_text = st.empty()    
+                st.session_state['validation_cancelled'] = False    
                 issues = []    
-    
-                # Parallel Processing    
-                with ThreadPoolExecutor() as executor:    
-                    futures = []    
-                    for slide_index in range(start_slide - 1, end_slide):    
-                        slide = presentation.slides[slide_index]    
-                        futures.append(executor.submit(validate_slide, slide, slide_index, default_font, spell, grammar_tool, decimal_places))    
-    
-                    for i, future in enumerate(futures):    
-                        slide_issues = future.result()    
-                        issues.extend(slide_issues)    
-                        progress_percent = int((i + 1) / len(futures) * 100)    
-                        progress_text.text(f"Progress: {progress_percent}%")    
-                        progress_bar.progress(progress_percent / 100)    
-    
-                # Save Results    
-                csv_output_path = Path(tmpdir) / "validation_report.csv"    
-                highlighted_ppt_path = Path(tmpdir) / "highlighted_presentation.pptx"    
-                save_to_csv(issues, csv_output_path)    
-                highlight_ppt(temp_ppt_path, highlighted_ppt_path, issues)    
-    
-                # Save results in session state    
-                st.session_state['csv_output'] = csv_output_path.read_bytes()    
-                st.session_state['ppt_output'] = highlighted_ppt_path.read_bytes()    
-                st.session_state['validation_completed'] = True    
-                st.session_state['issues'] = issues    
-                st.session_state['log_output_path'] = str(Path(tmpdir) / "validation_log.txt")    
-                st.success("Validation completed!")    
-    
-                # Write Log    
-                log_output_path = st.session_state['log_output_path']    
-                with open(log_output_path, "w") as log_file:    
-                    for handler in logging.root.handlers[:]:    
-                        logging.root.removeHandler(handler)    
-                    logging.basicConfig(filename=log_output_path, level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')    
-                    logging.debug(f"Validation completed with {len(issues)} issues.")    
-                    for issue in issues:    
-                        logging.debug(f"Issue: {issue}")    
+                # Kept in session state so a cancelled run can still report what it found    
+                st.session_state['partial_issues'] = issues    
+                stop_reason = run_validation(presentation, range(start_slide - 1, end_slide), default_font, decimal_places, fail_fast, issue_budget, issues)    
+                st.session_state.pop('partial_issues', None)    
+                save_results(temp_ppt_path, tmpdir, issues, stop_reason)    
+            elif st.session_state.get('validation_cancelled', False):    
+                st.session_state['validation_cancelled'] = False    
+                issues = st.session_state.pop('partial_issues', None)    
+                if issues is not None:    
+                    save_results(temp_ppt_path, tmpdir, issues, "Cancelled by user.")    
     
     # Show Download Button if validation is completed    
     if st.session_state.get('validation_completed', False):    
@@ -158,3 +229,4 @@ def main():
     
 if __name__ == "__main__":    
     main()    
+    
@@ -234,3 +234,6 @@ TECHNICAL_TERMS = {
 }  
   
 NUMERIC_TERMS = {f"{i}+" for i in range(1, 101)}  
+
+# Issue types that count as errors (rather than style warnings) for fail-fast runs
+ERROR_LEVEL_ISSUES = {"Misspelling", "Grammar Error"}